@@ -5,16 +5,19 @@ This module provides the core interfaces and data models for the BAML-based
 agent architecture that generates production-ready data pipelines from SOW documents.
 """
 
-from .base import BaseAgent, AgentResult
-from .sow_interpreter import SOWInterpreterAgent, DataContract
-from .data_fetcher import DataFetcherAgent, DataSource
-from .data_parser import DataParserAgent, ParsedData
-from .data_transformer import DataTransformerAgent, TransformationStrategy
-from .semantic_integrator import SemanticIntegratorAgent, SemanticAnnotation
-from .supervisor import SupervisorAgent, GeneratedPipeline
-from .security_decision import SecurityDecisionAgent, SecurityDecision
-from .data_discovery import DataDiscoveryAgent, DataSource as DiscoveredDataSource, DiscoveryContext
-from .source_recommender import SourceRecommendationEngine, SourceRecommendation, ExecutiveSummary
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import BaseAgent, AgentResult
+    from .sow_interpreter import SOWInterpreterAgent, DataContract
+    from .data_fetcher import DataFetcherAgent, DataSource
+    from .data_parser import DataParserAgent, ParsedData
+    from .data_transformer import DataTransformerAgent, TransformationStrategy
+    from .semantic_integrator import SemanticIntegratorAgent, SemanticAnnotation
+    from .supervisor import SupervisorAgent, GeneratedPipeline
+    from .security_decision import SecurityDecisionAgent, SecurityDecision
+    from .data_discovery import DataDiscoveryAgent, DataSource as DiscoveredDataSource, DiscoveryContext
+    from .source_recommender import SourceRecommendationEngine, SourceRecommendation, ExecutiveSummary
 
 __all__ = [
     # Base classes
@@ -44,4 +47,74 @@ __all__ = [
     "DiscoveryContext",
     "SourceRecommendation",
     "ExecutiveSummary",
-]
\ No newline at end of file
+]
+
+def __getattr__(name: str) -> object:
+    """Lazy import for performance."""
+    if name == "BaseAgent":
+        from .base import BaseAgent
+        return BaseAgent
+    elif name == "AgentResult":
+        from .base import AgentResult
+        return AgentResult
+    elif name == "SOWInterpreterAgent":
+        from .sow_interpreter import SOWInterpreterAgent
+        return SOWInterpreterAgent
+    elif name == "DataContract":
+        from .sow_interpreter import DataContract
+        return DataContract
+    elif name == "DataFetcherAgent":
+        from .data_fetcher import DataFetcherAgent
+        return DataFetcherAgent
+    elif name == "DataSource":
+        from .data_fetcher import DataSource
+        return DataSource
+    elif name == "DataParserAgent":
+        from .data_parser import DataParserAgent
+        return DataParserAgent
+    elif name == "ParsedData":
+        from .data_parser import ParsedData
+        return ParsedData
+    elif name == "DataTransformerAgent":
+        from .data_transformer import DataTransformerAgent
+        return DataTransformerAgent
+    elif name == "TransformationStrategy":
+        from .data_transformer import TransformationStrategy
+        return TransformationStrategy
+    elif name == "SemanticIntegratorAgent":
+        from .semantic_integrator import SemanticIntegratorAgent
+        return SemanticIntegratorAgent
+    elif name == "SemanticAnnotation":
+        from .semantic_integrator import SemanticAnnotation
+        return SemanticAnnotation
+    elif name == "SupervisorAgent":
+        from .supervisor import SupervisorAgent
+        return SupervisorAgent
+    elif name == "GeneratedPipeline":
+        from .supervisor import GeneratedPipeline
+        return GeneratedPipeline
+    elif name == "SecurityDecisionAgent":
+        from .security_decision import SecurityDecisionAgent
+        return SecurityDecisionAgent
+    elif name == "SecurityDecision":
+        from .security_decision import SecurityDecision
+        return SecurityDecision
+    elif name == "DataDiscoveryAgent":
+        from .data_discovery import DataDiscoveryAgent
+        return DataDiscoveryAgent
+    elif name == "DiscoveredDataSource":
+        from .data_discovery import DataSource as DiscoveredDataSource
+        return DiscoveredDataSource
+    elif name == "DiscoveryContext":
+        from .data_discovery import DiscoveryContext
+        return DiscoveryContext
+    elif name == "SourceRecommendationEngine":
+        from .source_recommender import SourceRecommendationEngine
+        return SourceRecommendationEngine
+    elif name == "SourceRecommendation":
+        from .source_recommender import SourceRecommendation
+        return SourceRecommendation
+    elif name == "ExecutiveSummary":
+        from .source_recommender import ExecutiveSummary
+        return ExecutiveSummary
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,7 +13,8 @@ Key Features:
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Tuple
+import heapq
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -23,10 +24,48 @@ from urllib.parse import urljoin, urlparse
 from dataclasses import dataclass, asdict
 
 from .base import BaseAgent, AgentResult
-from ..semantic.skos_router import SKOSSemanticRouter
+
+if TYPE_CHECKING:
+    # Type-only: importing the router pulls in KuzuDB and the vocabulary expander
+    from ..semantic.skos_router import SKOSSemanticRouter
 
 logger = logging.getLogger(__name__)
 
+# Quality scoring lookup tables (constant; shared by every source evaluation)
+_FREQUENCY_SCORES = {
+    "real-time": 1.0, "daily": 0.9, "weekly": 0.8,
+    "monthly": 0.7, "quarterly": 0.5, "static": 0.3
+}
+_ACCESS_SCORES = {
+    "public": 1.0, "registration": 0.8, "api_key": 0.7,
+    "subscription": 0.5, "request": 0.3
+}
+_STRATEGY_RELIABILITY = {
+    "government_portals": 0.9,
+    "international_organizations": 0.95,
+    "specialized_portals": 0.8,
+    "academic_sources": 0.75,
+    "web_search": 0.6
+}
+_FORMAT_SCORES = {"json": 1.0, "csv": 0.9, "xml": 0.8, "excel": 0.7}
+
+# Relevance scoring by geographic coverage
+_GEO_SCORES = {"global": 1.0, "national": 0.8, "regional": 0.6, "local": 0.4, "varies": 0.7}
+
+# Domain-specific international organization portals
+_INTERNATIONAL_DOMAINS = {
+    "agriculture": ("fao.org", "worldbank.org"),
+    "finance": ("imf.org", "worldbank.org", "bis.org"),
+    "trade": ("wto.org", "worldbank.org", "oecd.org"),
+    "health": ("who.int", "worldbank.org")
+}
+
+# Words ignored during key term extraction
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
+    "by", "is", "are", "was", "were", "be", "been", "being", "have", "has", "had"
+})
+
 
 @dataclass
 class DataSource:
@@ -61,6 +100,14 @@ class DiscoveryContext:
     semantic_mappings: Dict[str, Any]
 
 
+@dataclass
+class RelevanceProfile:
+    """Source-independent relevance inputs derived once per discovery context"""
+    needs_lower: List[str]  # external data needs, lowercased for matching
+    wants_real_time: bool
+    min_quality: float  # 0.0 to 1.0
+
+
 class DataDiscoveryAgent(BaseAgent):
     """
     BAML-powered agent for intelligent data source discovery.
@@ -74,7 +121,7 @@ class DataDiscoveryAgent(BaseAgent):
         agent_id: str = "data_discovery",
         logger: Optional[logging.Logger] = None,
         timeout_seconds: int = 600,
-        skos_router: Optional[SKOSSemanticRouter] = None
+        skos_router: Optional["SKOSSemanticRouter"] = None
     ):
         super().__init__(agent_id, logger, timeout_seconds)
         self.skos_router = skos_router
@@ -217,12 +264,12 @@ class DataDiscoveryAgent(BaseAgent):
             if source.quality_score >= min_quality_score
         ]
 
-        # Sort by combined score and limit results
-        sorted_sources = sorted(
+        # Rank by combined score and keep the top results (partial sort, same order as a full sort)
+        sorted_sources = heapq.nlargest(
+            max_sources,
             filtered_sources,
-            key=lambda s: (s.relevance_score + s.quality_score) / 2,
-            reverse=True
-        )[:max_sources]
+            key=lambda s: (s.relevance_score + s.quality_score) / 2
+        )
 
         self.logger.info(f"Discovery completed: {len(sorted_sources)} high-quality sources found")
 
@@ -261,13 +308,28 @@ class DataDiscoveryAgent(BaseAgent):
                 f"{context.business_domain} statistics"
             ])
 
+        # Deduplicate needs before capping so repeated entries don't consume router calls
+        seen_needs = set()
+        unique_needs = []
+        for need in context.external_data_needs:
+            need_clean = need.strip() if isinstance(need, str) else ""
+            if need_clean and need_clean not in seen_needs:
+                seen_needs.add(need_clean)
+                unique_needs.append(need_clean)
+
         # External data needs queries
-        for need in context.external_data_needs[:5]:  # Limit for performance
-            if self.skos_router and context.semantic_mappings:
-                # Use semantic routing to enhance queries
-                standardized_need = await self._standardize_term(need, context.primary_language)
-                if standardized_need != need:
-                    queries.append(f"{standardized_need} data")
+        needs = unique_needs[:5]  # Limit for performance
+        if self.skos_router and context.semantic_mappings:
+            # Use semantic routing to enhance queries; needs are routed concurrently
+            standardized_needs = await asyncio.gather(*[
+                self._standardize_term(need, context.primary_language) for need in needs
+            ])
+        else:
+            standardized_needs = needs
+
+        for need, standardized_need in zip(needs, standardized_needs):
+            if standardized_need != need:
+                queries.append(f"{standardized_need} data")
 
             queries.extend([
                 f"{need} data source",
@@ -291,8 +353,8 @@ class DataDiscoveryAgent(BaseAgent):
                     f"{suggestion} API"
                 ])
 
-        # Remove duplicates and return
-        return list(set(queries))
+        # Remove duplicates, keeping first-seen order so strategies get a stable query list
+        return list(dict.fromkeys(queries))
 
     async def _standardize_term(self, term: str, language: str) -> str:
         """Standardize term using SKOS router if available"""
@@ -300,7 +362,10 @@ class DataDiscoveryAgent(BaseAgent):
             return term
 
         try:
-            routing_result = self.skos_router.route_term_to_preferred(term, language, "en")
+            # Routing is blocking (KuzuDB lookups, possibly remote vocabulary expansion)
+            routing_result = await asyncio.to_thread(
+                self.skos_router.route_term_to_preferred, term, language, "en"
+            )
             if routing_result.get("preferred_label"):
                 return routing_result["preferred_label"]
         except Exception as e:
@@ -311,13 +376,8 @@ class DataDiscoveryAgent(BaseAgent):
     def _extract_key_terms(self, text: str) -> List[str]:
         """Extract key business terms from text"""
         # Simple keyword extraction - can be enhanced with NLP
-        stop_words = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with",
-            "by", "is", "are", "was", "were", "be", "been", "being", "have", "has", "had"
-        }
-
         words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-        key_terms = [word for word in words if word not in stop_words]
+        key_terms = [word for word in words if word not in _STOP_WORDS]
 
         # Return unique terms, prioritizing longer ones
         return list(set(key_terms))
@@ -352,6 +412,7 @@ class DataDiscoveryAgent(BaseAgent):
     ) -> List[DataSource]:
         """Discover government open data sources"""
         sources = []
+        discovered_at = datetime.utcnow().isoformat()
 
         for domain in config.get("domains", []):
             # Simulate discovery - in real implementation, would crawl/search these domains
@@ -368,7 +429,7 @@ class DataDiscoveryAgent(BaseAgent):
                     relevance_score=0.0,  # Will be calculated later
                     business_domains=[context.business_domain],
                     geographic_coverage="national",
-                    discovered_at=datetime.utcnow().isoformat(),
+                    discovered_at=discovered_at,
                     metadata={
                         "strategy": "government_portals",
                         "domain": domain,
@@ -383,16 +444,10 @@ class DataDiscoveryAgent(BaseAgent):
     ) -> List[DataSource]:
         """Discover international organization data sources"""
         sources = []
+        discovered_at = datetime.utcnow().isoformat()
 
         # Domain-specific international sources
-        domain_mappings = {
-            "agriculture": ["fao.org", "worldbank.org"],
-            "finance": ["imf.org", "worldbank.org", "bis.org"],
-            "trade": ["wto.org", "worldbank.org", "oecd.org"],
-            "health": ["who.int", "worldbank.org"]
-        }
-
-        relevant_domains = domain_mappings.get(context.business_domain, ["worldbank.org"])
+        relevant_domains = _INTERNATIONAL_DOMAINS.get(context.business_domain, ("worldbank.org",))
 
         for domain in relevant_domains:
             sources.append(DataSource(
@@ -407,7 +462,7 @@ class DataDiscoveryAgent(BaseAgent):
                 relevance_score=0.0,
                 business_domains=[context.business_domain],
                 geographic_coverage="global",
-                discovered_at=datetime.utcnow().isoformat(),
+                discovered_at=discovered_at,
                 metadata={
                     "strategy": "international_organizations",
                     "organization": domain,
@@ -422,6 +477,7 @@ class DataDiscoveryAgent(BaseAgent):
     ) -> List[DataSource]:
         """Discover domain-specific specialized sources"""
         sources = []
+        discovered_at = datetime.utcnow().isoformat()
 
         domain_specific = config.get("domain_specific", {})
         specialized_domains = domain_specific.get(context.business_domain, [])
@@ -439,7 +495,7 @@ class DataDiscoveryAgent(BaseAgent):
                 relevance_score=0.0,
                 business_domains=[context.business_domain],
                 geographic_coverage="varies",
-                discovered_at=datetime.utcnow().isoformat(),
+                discovered_at=discovered_at,
                 metadata={
                     "strategy": "specialized_portals",
                     "specialization": context.business_domain,
@@ -454,6 +510,7 @@ class DataDiscoveryAgent(BaseAgent):
     ) -> List[DataSource]:
         """Discover academic and research data sources"""
         sources = []
+        discovered_at = datetime.utcnow().isoformat()
 
         # Simulate academic source discovery
         for external_need in context.external_data_needs[:3]:
@@ -469,7 +526,7 @@ class DataDiscoveryAgent(BaseAgent):
                 relevance_score=0.0,
                 business_domains=[context.business_domain],
                 geographic_coverage="varies",
-                discovered_at=datetime.utcnow().isoformat(),
+                discovered_at=discovered_at,
                 metadata={
                     "strategy": "academic_sources",
                     "platform": "kaggle",
@@ -484,6 +541,7 @@ class DataDiscoveryAgent(BaseAgent):
     ) -> List[DataSource]:
         """Generic web-based source discovery"""
         sources = []
+        discovered_at = datetime.utcnow().isoformat()
 
         # Simulate web discovery results
         for i, query in enumerate(queries[:5]):  # Limit for demo
@@ -499,7 +557,7 @@ class DataDiscoveryAgent(BaseAgent):
                 relevance_score=0.0,
                 business_domains=[context.business_domain],
                 geographic_coverage="varies",
-                discovered_at=datetime.utcnow().isoformat(),
+                discovered_at=discovered_at,
                 metadata={
                     "strategy": "web_search",
                     "query": query,
@@ -525,13 +583,16 @@ class DataDiscoveryAgent(BaseAgent):
         self, sources: List[DataSource], context: DiscoveryContext
     ) -> List[DataSource]:
         """Evaluate and score sources for quality and relevance"""
+        relevance_profile = self._relevance_profile(context)
 
         for source in sources:
             # Calculate quality score
             source.quality_score = await self._calculate_quality_score(source, context)
 
             # Calculate relevance score
-            source.relevance_score = await self._calculate_relevance_score(source, context)
+            source.relevance_score = await self._calculate_relevance_score(
+                source, context, relevance_profile
+            )
 
         return sources
 
@@ -544,37 +605,21 @@ class DataDiscoveryAgent(BaseAgent):
         scores["documentation_quality"] = 0.8 if source.source_type in ["api", "portal"] else 0.6
 
         # Update frequency
-        frequency_scores = {
-            "real-time": 1.0, "daily": 0.9, "weekly": 0.8,
-            "monthly": 0.7, "quarterly": 0.5, "static": 0.3
-        }
-        scores["update_frequency"] = frequency_scores.get(source.update_frequency, 0.5)
+        scores["update_frequency"] = _FREQUENCY_SCORES.get(source.update_frequency, 0.5)
 
         # Data completeness (simulated based on source type)
         scores["data_completeness"] = 0.9 if source.source_type == "api" else 0.7
 
         # Accessibility
-        access_scores = {
-            "public": 1.0, "registration": 0.8, "api_key": 0.7,
-            "subscription": 0.5, "request": 0.3
-        }
-        scores["accessibility"] = access_scores.get(source.access_method, 0.5)
+        scores["accessibility"] = _ACCESS_SCORES.get(source.access_method, 0.5)
 
         # Reliability (based on source strategy)
-        strategy_reliability = {
-            "government_portals": 0.9,
-            "international_organizations": 0.95,
-            "specialized_portals": 0.8,
-            "academic_sources": 0.75,
-            "web_search": 0.6
-        }
-        scores["reliability"] = strategy_reliability.get(
+        scores["reliability"] = _STRATEGY_RELIABILITY.get(
             source.metadata.get("strategy", "web_search"), 0.6
         )
 
         # Format quality
-        format_scores = {"json": 1.0, "csv": 0.9, "xml": 0.8, "excel": 0.7}
-        avg_format_score = sum(format_scores.get(fmt, 0.5) for fmt in source.data_formats) / len(source.data_formats)
+        avg_format_score = sum(_FORMAT_SCORES.get(fmt, 0.5) for fmt in source.data_formats) / len(source.data_formats)
         scores["format_quality"] = avg_format_score
 
         # Metadata richness (simulated)
@@ -585,10 +630,32 @@ class DataDiscoveryAgent(BaseAgent):
 
         return min(1.0, max(0.0, total_score))
 
-    async def _calculate_relevance_score(self, source: DataSource, context: DiscoveryContext) -> float:
+    def _relevance_profile(self, context: DiscoveryContext) -> RelevanceProfile:
+        """Derive the source-independent inputs of relevance scoring from the context"""
+        needs_lower = [need.lower() for need in context.external_data_needs]
+        wants_real_time = "real-time" in " ".join(context.quality_requirements).lower()
+
+        min_quality = 0.7  # Default threshold
+        for req in context.quality_requirements:
+            if "%" in req:
+                try:
+                    threshold = float(re.search(r'(\d+(?:\.\d+)?)%', req).group(1)) / 100
+                    min_quality = max(min_quality, threshold)
+                except (AttributeError, ValueError):
+                    pass
+
+        return RelevanceProfile(needs_lower, wants_real_time, min_quality)
+
+    async def _calculate_relevance_score(
+        self,
+        source: DataSource,
+        context: DiscoveryContext,
+        relevance_profile: Optional[RelevanceProfile] = None
+    ) -> float:
         """Calculate relevance score based on business context alignment"""
         factors = self.source_evaluators["relevance_factors"]
         scores = {}
+        profile = relevance_profile or self._relevance_profile(context)
 
         # Business domain match
         domain_match = 1.0 if context.business_domain in source.business_domains else 0.3
@@ -596,34 +663,25 @@ class DataDiscoveryAgent(BaseAgent):
 
         # Data type alignment (check if external needs are mentioned in source)
         alignment_score = 0.0
-        for need in context.external_data_needs:
-            if any(need.lower() in source.title.lower() or
-                   need.lower() in source.description.lower() for need in [need]):
+        title_lower = source.title.lower()
+        description_lower = source.description.lower()
+        for need in profile.needs_lower:
+            if need in title_lower or need in description_lower:
                 alignment_score += 0.2
         scores["data_type_alignment"] = min(1.0, alignment_score)
 
         # Geographic relevance (simplified)
-        geo_scores = {"global": 1.0, "national": 0.8, "regional": 0.6, "local": 0.4, "varies": 0.7}
-        scores["geographic_relevance"] = geo_scores.get(source.geographic_coverage, 0.5)
+        scores["geographic_relevance"] = _GEO_SCORES.get(source.geographic_coverage, 0.5)
 
         # Temporal alignment (update frequency vs requirements)
-        if "real-time" in " ".join(context.quality_requirements).lower():
+        if profile.wants_real_time:
             temporal_score = 1.0 if source.update_frequency in ["real-time", "daily"] else 0.5
         else:
             temporal_score = 0.8  # Good enough for most cases
         scores["temporal_alignment"] = temporal_score
 
         # Quality threshold match
-        min_quality = 0.7  # Default threshold
-        for req in context.quality_requirements:
-            if "%" in req:
-                try:
-                    threshold = float(re.search(r'(\d+(?:\.\d+)?)%', req).group(1)) / 100
-                    min_quality = max(min_quality, threshold)
-                except:
-                    pass
-
-        scores["quality_threshold_match"] = 1.0 if source.quality_score >= min_quality else 0.5
+        scores["quality_threshold_match"] = 1.0 if source.quality_score >= profile.min_quality else 0.5
 
         # Calculate weighted score
         total_score = sum(scores[factor] * weight for factor, weight in factors.items())
@@ -650,18 +708,25 @@ class DataDiscoveryAgent(BaseAgent):
     ) -> str:
         """Export discovery results in specified format"""
 
+        # Accumulate both score totals in a single pass over the sources
+        quality_total = relevance_total = 0.0
+        for source in sources:
+            quality_total += source.quality_score
+            relevance_total += source.relevance_score
+
         export_data = {
             "discovery_metadata": {
                 "agent_id": self.agent_id,
                 "discovery_timestamp": datetime.utcnow().isoformat(),
                 "total_sources": len(sources),
-                "avg_quality_score": sum(s.quality_score for s in sources) / len(sources) if sources else 0.0,
-                "avg_relevance_score": sum(s.relevance_score for s in sources) / len(sources) if sources else 0.0
+                "avg_quality_score": quality_total / len(sources) if sources else 0.0,
+                "avg_relevance_score": relevance_total / len(sources) if sources else 0.0
             },
             "sources": [asdict(source) for source in sources]
         }
 
         if format == "json":
-            return json.dumps(export_data, indent=2, ensure_ascii=False)
+            # Without indent, json serializes through its C encoder
+            return json.dumps(export_data, separators=(",", ":"), ensure_ascii=False)
         else:
             raise ValueError(f"Unsupported export format: {format}")
\ No newline at end of file
@@ -13,9 +13,10 @@ from typing import Dict, List, Optional, Any
 from dataclasses import asdict
 from pathlib import Path
 
-# Add project root to path for baml_client import
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path for baml_client import (once; other modules share the entry)
+project_root = str(Path(__file__).parent.parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from baml_client import b
 from baml_client.types import (
@@ -79,22 +80,7 @@ class ExecutiveTargetScorerAgent:
             )
 
             # Convert to model format
-            model_result = ModelTargetParsingResult(
-                key_themes=parsing_result.key_themes,
-                quantitative_targets=parsing_result.quantitative_targets,
-                timeframes=parsing_result.timeframes,
-                stakeholders=parsing_result.stakeholders,
-                success_indicators=parsing_result.success_indicators,
-                suggested_category=parsing_result.suggested_category.value if parsing_result.suggested_category else None,
-                suggested_priority=parsing_result.suggested_priority.value if parsing_result.suggested_priority else None,
-                complexity_score=parsing_result.complexity_score,
-                required_data_types=parsing_result.required_data_types,
-                suggested_metrics=parsing_result.suggested_metrics,
-                potential_data_sources=parsing_result.potential_data_sources,
-                confidence=parsing_result.confidence,
-                parsing_method="baml_agent",
-                parsed_at=datetime.now()
-            )
+            model_result = self._to_model_parsing_result(parsing_result)
 
             logger.info(f"Target parsing completed with {model_result.confidence:.2f} confidence")
             return model_result
@@ -103,6 +89,87 @@ class ExecutiveTargetScorerAgent:
             logger.error(f"Error parsing executive target: {e}")
             raise
 
+    async def parse_executive_targets_batch(
+        self,
+        target_descriptions: List[str],
+        enterprise_context: Dict[str, str],
+        batch_size: int = 5,
+        max_concurrent: int = 10
+    ) -> List[Optional[ModelTargetParsingResult]]:
+        """
+        Parse target descriptions several at a time in a single BAML prompt.
+
+        Packing targets shares the instructions and enterprise context across a
+        batch instead of repeating both for every target. A batch whose call fails
+        or returns the wrong number of results is parsed one target at a time.
+
+        Args:
+            target_descriptions: Natural language target descriptions
+            enterprise_context: Enterprise-specific context for parsing
+            batch_size: Maximum number of targets packed into one prompt
+            max_concurrent: Maximum number of BAML calls in flight
+
+        Returns:
+            Parsing results in the same order as target_descriptions, with None
+            for targets that could not be parsed
+        """
+        batches = [
+            target_descriptions[i:i + batch_size]
+            for i in range(0, len(target_descriptions), batch_size)
+        ]
+        logger.info(f"Parsing {len(target_descriptions)} targets in {len(batches)} batched calls")
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def parse_single(description: str) -> Optional[ModelTargetParsingResult]:
+            async with semaphore:
+                try:
+                    return await self.parse_executive_target(description, enterprise_context)
+                except Exception as e:
+                    logger.error(f"Error parsing target '{description[:50]}': {e}")
+                    return None
+
+        async def parse_batch(batch: List[str]) -> List[Optional[ModelTargetParsingResult]]:
+            async with semaphore:
+                try:
+                    parsing_results = await b.ParseExecutiveTargetsBatch(
+                        target_descriptions=batch,
+                        enterprise_context=enterprise_context
+                    )
+                    if len(parsing_results) == len(batch):
+                        return [self._to_model_parsing_result(result) for result in parsing_results]
+                    # Results can't be matched back to targets
+                    logger.warning(
+                        f"Batched parsing returned {len(parsing_results)} results for {len(batch)} targets"
+                    )
+                except Exception as e:
+                    logger.warning(f"Batched parsing failed for {len(batch)} targets: {e}")
+
+            # Parse this batch one by one, outside the batch's semaphore slot
+            return list(await asyncio.gather(*[parse_single(description) for description in batch]))
+
+        batch_results = await asyncio.gather(*[parse_batch(batch) for batch in batches])
+        return [result for batch in batch_results for result in batch]
+
+    def _to_model_parsing_result(self, parsing_result: TargetParsingResult) -> ModelTargetParsingResult:
+        """Convert a BAML parsing result to the model format"""
+        return ModelTargetParsingResult(
+            key_themes=parsing_result.key_themes,
+            quantitative_targets=parsing_result.quantitative_targets,
+            timeframes=parsing_result.timeframes,
+            stakeholders=parsing_result.stakeholders,
+            success_indicators=parsing_result.success_indicators,
+            suggested_category=parsing_result.suggested_category.value if parsing_result.suggested_category else None,
+            suggested_priority=parsing_result.suggested_priority.value if parsing_result.suggested_priority else None,
+            complexity_score=parsing_result.complexity_score,
+            required_data_types=parsing_result.required_data_types,
+            suggested_metrics=parsing_result.suggested_metrics,
+            potential_data_sources=parsing_result.potential_data_sources,
+            confidence=parsing_result.confidence,
+            parsing_method="baml_agent",
+            parsed_at=datetime.now()
+        )
+
     async def create_executive_target_from_parsing(
         self,
         parsing_result: ModelTargetParsingResult,
@@ -153,11 +220,57 @@ class ExecutiveTargetScorerAgent:
             logger.error(f"Error creating executive target: {e}")
             raise
 
+    async def batch_parse_targets(
+        self,
+        target_descriptions: List[str],
+        enterprise_context: Dict[str, str],
+        max_concurrent: int = 10,
+        batch_size: int = 5
+    ) -> List[ModelExecutiveTarget]:
+        """
+        Parse multiple target descriptions into executive targets.
+
+        Descriptions are parsed through parse_executive_targets_batch, so several
+        targets share each BAML call.
+
+        Args:
+            target_descriptions: Natural language target descriptions
+            enterprise_context: Enterprise-specific context for parsing
+            max_concurrent: Maximum number of BAML calls in flight
+            batch_size: Maximum number of targets packed into one prompt
+
+        Returns:
+            Executive targets for the descriptions that parsed successfully
+        """
+        descriptions = [d.strip() for d in target_descriptions if d.strip()]
+        logger.info(f"Batch parsing {len(descriptions)} targets")
+
+        parsing_results = await self.parse_executive_targets_batch(
+            descriptions, enterprise_context, batch_size=batch_size, max_concurrent=max_concurrent
+        )
+
+        targets = []
+        for description, parsing_result in zip(descriptions, parsing_results):
+            if parsing_result is None:
+                continue
+
+            try:
+                targets.append(
+                    await self.create_executive_target_from_parsing(parsing_result, description)
+                )
+            except Exception as e:
+                logger.error(f"Error creating target '{description[:50]}': {e}")
+                continue
+
+        logger.info(f"Batch parsing completed for {len(targets)} targets")
+        return targets
+
     async def score_strategic_alignment(
         self,
         target: ModelExecutiveTarget,
         canvas_data: Dict[str, Any],
-        enterprise_context: Dict[str, str]
+        enterprise_context: Dict[str, str],
+        baml_canvas: Optional[DataBusinessCanvas] = None
     ) -> ModelAlignmentScore:
         """
         Score strategic alignment between data initiative and executive target.
@@ -166,52 +279,25 @@ class ExecutiveTargetScorerAgent:
             target: Executive target to align against
             canvas_data: Data Business Canvas data
             enterprise_context: Enterprise-specific context
+            baml_canvas: Pre-converted canvas_data, reused when scoring many targets
 
         Returns:
             Multi-dimensional alignment score with detailed analysis
         """
         logger.info(f"Scoring alignment for target: {target.title}")
 
+        # Nothing to align against: skip the BAML round-trip for a known zero score
+        if self._is_sparse_canvas(canvas_data):
+            logger.info("Canvas has no value propositions or key activities; skipping alignment scoring")
+            return self._sparse_canvas_score()
+
         try:
             # Convert target to BAML format
-            baml_target = ExecutiveTarget(
-                id=target.id,
-                title=target.title,
-                description=target.description,
-                category=TargetCategory(target.category.upper()),
-                priority=TargetPriority(target.priority.upper()),
-                owner=target.owner,
-                owner_role=target.owner_role,
-                deadline=target.deadline.isoformat() if target.deadline else None,
-                success_metrics=target.success_metrics,
-                target_value=target.target_value,
-                baseline_value=target.baseline_value,
-                business_domain=target.business_domain,
-                stakeholders=target.stakeholders,
-                dependencies=target.dependencies,
-                constraints=target.constraints,
-                status=target.status
-            )
+            baml_target = self._create_baml_target(target)
 
             # Create BAML canvas representation
-            baml_canvas = DataBusinessCanvas(
-                value_propositions=canvas_data.get('value_propositions', []),
-                key_activities=canvas_data.get('key_activities', []),
-                key_resources=canvas_data.get('key_resources', []),
-                key_partnerships=canvas_data.get('key_partnerships', []),
-                customer_segments=canvas_data.get('customer_segments', []),
-                customer_relationships=canvas_data.get('customer_relationships', []),
-                channels=canvas_data.get('channels', []),
-                cost_structure=canvas_data.get('cost_structure', []),
-                revenue_streams=canvas_data.get('revenue_streams', []),
-                data_assets=canvas_data.get('data_assets', []),
-                intelligence_capabilities=canvas_data.get('intelligence_capabilities', []),
-                competitive_advantages=canvas_data.get('competitive_advantages', []),
-                business_domain=canvas_data.get('business_domain', ''),
-                use_case_description=canvas_data.get('use_case_description', ''),
-                timeline=canvas_data.get('timeline', ''),
-                budget=canvas_data.get('budget', '')
-            )
+            if baml_canvas is None:
+                baml_canvas = self._create_baml_canvas(canvas_data)
 
             # Execute BAML alignment scoring
             alignment_result = await b.ScoreStrategicAlignment(
@@ -287,24 +373,7 @@ class ExecutiveTargetScorerAgent:
             )
 
             # Convert target to BAML format
-            baml_target = ExecutiveTarget(
-                id=target.id,
-                title=target.title,
-                description=target.description,
-                category=TargetCategory(target.category.upper()),
-                priority=TargetPriority(target.priority.upper()),
-                owner=target.owner,
-                owner_role=target.owner_role,
-                deadline=target.deadline.isoformat() if target.deadline else None,
-                success_metrics=target.success_metrics,
-                target_value=target.target_value,
-                baseline_value=target.baseline_value,
-                business_domain=target.business_domain,
-                stakeholders=target.stakeholders,
-                dependencies=target.dependencies,
-                constraints=target.constraints,
-                status=target.status
-            )
+            baml_target = self._create_baml_target(target)
 
             # Create BAML canvas
             baml_canvas = self._create_baml_canvas(canvas_data)
@@ -372,6 +441,54 @@ class ExecutiveTargetScorerAgent:
             logger.error(f"Error creating target template: {e}")
             raise
 
+    def _is_sparse_canvas(self, canvas_data: Dict[str, Any]) -> bool:
+        """Check whether the canvas has nothing a target could align with"""
+        return not canvas_data.get('value_propositions') and not canvas_data.get('key_activities')
+
+    def _sparse_canvas_score(self) -> ModelAlignmentScore:
+        """Zero alignment score for a canvas too sparse to score"""
+        return ModelAlignmentScore(
+            reasoning="Canvas is too sparse for alignment scoring",
+            recommendations=["Add value propositions and key activities to the canvas"]
+        )
+
+    def _to_target_alignment(
+        self,
+        target: ModelExecutiveTarget,
+        canvas_data: Dict[str, Any],
+        score: ModelAlignmentScore
+    ) -> TargetAlignment:
+        """Build the alignment record for a scored target"""
+        return TargetAlignment(
+            target_id=target.id,
+            initiative_id=canvas_data.get('id', 'unknown'),
+            alignment_score=score,
+            contribution_type="direct" if score.overall_score > 0.7 else "indirect",
+            expected_impact=f"High impact potential: {score.impact_potential:.2f}",
+            timeline_match="aligned" if score.timeline_feasibility > 0.6 else "delayed"
+        )
+
+    def _create_baml_target(self, target: ModelExecutiveTarget) -> ExecutiveTarget:
+        """Convert executive target to BAML format"""
+        return ExecutiveTarget(
+            id=target.id,
+            title=target.title,
+            description=target.description,
+            category=TargetCategory(target.category.upper()),
+            priority=TargetPriority(target.priority.upper()),
+            owner=target.owner,
+            owner_role=target.owner_role,
+            deadline=target.deadline.isoformat() if target.deadline else None,
+            success_metrics=target.success_metrics,
+            target_value=target.target_value,
+            baseline_value=target.baseline_value,
+            business_domain=target.business_domain,
+            stakeholders=target.stakeholders,
+            dependencies=target.dependencies,
+            constraints=target.constraints,
+            status=target.status
+        )
+
     def _create_baml_canvas(self, canvas_data: Dict[str, Any]) -> DataBusinessCanvas:
         """Convert canvas data to BAML format"""
         return DataBusinessCanvas(
@@ -397,7 +514,8 @@ class ExecutiveTargetScorerAgent:
         self,
         targets: List[ModelExecutiveTarget],
         canvas_data: Dict[str, Any],
-        enterprise_context: Dict[str, str]
+        enterprise_context: Dict[str, str],
+        max_concurrent: int = 10
     ) -> List[TargetAlignment]:
         """
         Score alignment for multiple targets efficiently.
@@ -406,33 +524,41 @@ class ExecutiveTargetScorerAgent:
             targets: List of executive targets
             canvas_data: Data Business Canvas data
             enterprise_context: Enterprise context
+            max_concurrent: Maximum number of BAML scoring calls in flight
 
         Returns:
             List of target alignments with scores
         """
         logger.info(f"Batch scoring {len(targets)} targets")
 
-        alignments = []
-        for target in targets:
-            try:
-                score = await self.score_strategic_alignment(
-                    target, canvas_data, enterprise_context
-                )
-
-                alignment = TargetAlignment(
-                    target_id=target.id,
-                    initiative_id=canvas_data.get('id', 'unknown'),
-                    alignment_score=score,
-                    contribution_type="direct" if score.overall_score > 0.7 else "indirect",
-                    expected_impact=f"High impact potential: {score.impact_potential:.2f}",
-                    timeline_match="aligned" if score.timeline_feasibility > 0.6 else "delayed"
-                )
-
-                alignments.append(alignment)
-
-            except Exception as e:
-                logger.error(f"Error scoring target {target.id}: {e}")
-                continue
+        # The canvas is shared, so a sparse one scores every target as zero
+        if self._is_sparse_canvas(canvas_data):
+            logger.info("Canvas has no value propositions or key activities; skipping alignment scoring")
+            return [
+                self._to_target_alignment(target, canvas_data, self._sparse_canvas_score())
+                for target in targets
+            ]
+
+        # The canvas is the same for every target, so convert it once
+        baml_canvas = self._create_baml_canvas(canvas_data)
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def score_target(target: ModelExecutiveTarget) -> Optional[TargetAlignment]:
+            async with semaphore:
+                try:
+                    score = await self.score_strategic_alignment(
+                        target, canvas_data, enterprise_context, baml_canvas
+                    )
+
+                    return self._to_target_alignment(target, canvas_data, score)
+
+                except Exception as e:
+                    logger.error(f"Error scoring target {target.id}: {e}")
+                    return None
+
+        # Scoring calls are independent; gather keeps results in target order
+        results = await asyncio.gather(*[score_target(target) for target in targets])
+        alignments = [alignment for alignment in results if alignment is not None]
 
         logger.info(f"Batch scoring completed for {len(alignments)} targets")
         return alignments
\ No newline at end of file
@@ -23,7 +23,6 @@ import re
 
 from .data_discovery import DataSource, DiscoveryContext
 from .base import BaseAgent
-from ..semantic.skos_router import SKOSSemanticRouter
 
 logger = logging.getLogger(__name__)
 
@@ -741,7 +740,7 @@ class SourceRecommendationEngine(BaseAgent):
         }
 
         if format == "json":
-            return json.dumps(export_data, indent=2, ensure_ascii=False)
+            return json.dumps(export_data, separators=(",", ":"), ensure_ascii=False)
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
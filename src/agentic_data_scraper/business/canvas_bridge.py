@@ -141,7 +141,7 @@ class DataBusinessCanvas:
     def _update_completeness_score(self):
         """Calculate canvas completeness based on populated components"""
         total_components = len(CanvasComponentType)
-        populated_components = len([ct for ct in CanvasComponentType if ct in self.components])
+        populated_components = len(self.components)
         self.completeness_score = populated_components / total_components
 
 
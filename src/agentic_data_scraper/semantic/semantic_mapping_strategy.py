@@ -561,8 +561,8 @@ def create_meaning_preserving_semantic_mapper(kuzu_db_path: str = None) -> Seman
     skos_router = None
     if kuzu_db_path:
         try:
-            from .skos_router import SKOSSemanticRouter
-            skos_router = SKOSSemanticRouter(kuzu_db_path)
+            from .skos_router import get_shared_skos_router
+            skos_router = get_shared_skos_router(kuzu_db_path)
         except ImportError:
             logger.warning("SKOS router not available - semantic mapping will be limited")
     
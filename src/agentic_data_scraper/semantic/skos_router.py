@@ -13,15 +13,128 @@ Key Benefits:
 - Crisis-ready supply chain vocabulary
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
+from contextlib import contextmanager, suppress
 import kuzu
 from datetime import datetime
 import logging
 import asyncio
+import atexit
+import os
+import queue
+import threading
+from collections import OrderedDict
 from .vocabulary_expander import SKOSVocabularyExpander
 
 logger = logging.getLogger(__name__)
 
+# Number of read connections kept open per router; a pool needs at least one
+try:
+    _KUZU_POOL_SIZE = max(1, int(os.environ.get("CANVAS_KUZU_POOL", "4")))
+except ValueError:
+    logger.warning("Ignoring non-integer CANVAS_KUZU_POOL; using 4 connections")
+    _KUZU_POOL_SIZE = 4
+
+# Maximum number of successful routing results remembered per router
+_ROUTE_CACHE_SIZE = 1024
+
+# Seconds a routing call waits for vocabulary expansion before giving up
+_EXPANSION_TIMEOUT = 30.0
+
+# Seconds close() waits for the expander's HTTP session to shut down
+_SESSION_CLOSE_TIMEOUT = 5.0
+
+# Long-lived event loop for vocabulary expansion, started on first use
+_expansion_loop: Optional[asyncio.AbstractEventLoop] = None
+_expansion_loop_lock = threading.Lock()
+_EXPANSION_THREAD_NAME = "skos-vocabulary-expansion"
+
+# Shared routers keyed by (absolute KuzuDB path, Fuseki endpoint)
+_shared_routers: Dict[tuple, "SKOSSemanticRouter"] = {}
+_shared_routers_lock = threading.Lock()
+
+
+def _get_expansion_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the background event loop used for vocabulary expansion.
+
+    Routing is synchronous, but expansion is async. Running it on one persistent
+    loop thread avoids building a new loop for every routing miss and also works
+    when the router is called from code that already has a running loop.
+    """
+    global _expansion_loop
+    with _expansion_loop_lock:
+        if _expansion_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name=_EXPANSION_THREAD_NAME, daemon=True
+            ).start()
+            _expansion_loop = loop
+    return _expansion_loop
+
+
+class KuzuConnectionPool:
+    """Fixed-size pool of pre-opened connections to one KuzuDB database"""
+
+    def __init__(self, db: kuzu.Database, size: int = _KUZU_POOL_SIZE):
+        """
+        Open the pooled connections
+
+        Args:
+            db: Open KuzuDB database the connections belong to
+            size: Number of connections to keep open
+        """
+        size = max(1, size)
+        self._connections: "queue.Queue[Optional[kuzu.Connection]]" = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._connections.put(kuzu.Connection(db))
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def acquire(self) -> kuzu.Connection:
+        """Take a connection, blocking until one is free"""
+        conn = self._connections.get()
+        if conn is None:
+            # Closed pool: pass the wake-up on to the next blocked caller
+            self._connections.put_nowait(None)
+            raise RuntimeError("KuzuDB connection pool is closed")
+        return conn
+
+    def release(self, conn: kuzu.Connection) -> None:
+        """Return a connection taken with acquire()"""
+        with self._lock:
+            if not self._closed:
+                self._connections.put_nowait(conn)
+                return
+        # Returned after close(); the borrower was the last user
+        conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[kuzu.Connection]:
+        """Borrow a connection for the duration of a with-block"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones are closed when released"""
+        idle = []
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            while True:
+                try:
+                    idle.append(self._connections.get_nowait())
+                except queue.Empty:
+                    break
+            # Wake callers blocked in acquire() so they fail instead of waiting forever
+            self._connections.put_nowait(None)
+        for conn in idle:
+            conn.close()
+
 
 class SKOSSemanticRouter:
     """Routes multilingual terms to preferred labels via SKOS concepts in KuzuDB"""
@@ -37,8 +150,13 @@ class SKOSSemanticRouter:
         self.kuzu_db_path = kuzu_db_path
         self.db = None
         self.conn = None
+        self.pool: Optional[KuzuConnectionPool] = None
         self.fuseki_endpoint = fuseki_endpoint
 
+        # LRU of resolved routings keyed by (normalized term, source, target language)
+        self._route_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._route_cache_lock = threading.Lock()
+
         # Initialize vocabulary expander for enhanced semantic coverage
         self.vocabulary_expander = SKOSVocabularyExpander()
 
@@ -46,7 +164,6 @@ class SKOSSemanticRouter:
 
     def _initialize_database_robust(self):
         """Robustly initialize KuzuDB with lock handling and cleanup"""
-        import os
         import time
         from pathlib import Path
 
@@ -60,27 +177,16 @@ class SKOSSemanticRouter:
                 db_dir.mkdir(parents=True, exist_ok=True)
 
                 # Close any existing connections first
-                if self.conn is not None:
-                    try:
-                        self.conn.close()
-                    except:
-                        pass
-
-                if self.db is not None:
-                    try:
-                        self.db.close()
-                    except:
-                        pass
+                self._close_database()
 
                 # Clean up potential lock files (KuzuDB creates .lock files)
                 lock_pattern = f"{self.kuzu_db_path}*.lock"
                 import glob
                 for lock_file in glob.glob(lock_pattern):
-                    try:
-                        os.remove(lock_file)
+                    # Ignore if it vanished meanwhile or we can't remove it
+                    with suppress(OSError):
+                        os.unlink(lock_file)
                         logger.info(f"Removed stale lock file: {lock_file}")
-                    except:
-                        pass  # Ignore if we can't remove it
 
                 # Initialize database with fresh connection
                 self.db = kuzu.Database(self.kuzu_db_path)
@@ -89,6 +195,10 @@ class SKOSSemanticRouter:
                 # Test the connection
                 self.conn.execute("RETURN 1")
 
+                # Lookups borrow pooled connections so concurrent callers of a
+                # shared router don't serialize on the setup/write connection
+                self.pool = KuzuConnectionPool(self.db)
+
                 logger.info(f"KuzuDB initialized successfully at: {self.kuzu_db_path}")
                 self.setup_skos_routing_tables()
                 return
@@ -102,21 +212,50 @@ class SKOSSemanticRouter:
                     logger.error(f"Failed to initialize KuzuDB after {max_retries} attempts")
                     raise RuntimeError(f"Could not initialize KuzuDB: {e}")
 
-    def close(self):
-        """Properly close database connections"""
+    def close(self, wait: bool = True):
+        """
+        Properly close database connections and the expander's HTTP session
+
+        Args:
+            wait: Block until the HTTP session has closed, for at most
+                _SESSION_CLOSE_TIMEOUT seconds; otherwise only schedule it
+        """
+        self._close_database()
+
+        # The expander's HTTP session belongs to the expansion loop; close it there
+        expander = getattr(self, "vocabulary_expander", None)
+        if expander is None or _expansion_loop is None or not _expansion_loop.is_running():
+            return
         try:
-            if self.conn:
-                self.conn.close()
-                self.conn = None
-            if self.db:
-                self.db.close()
-                self.db = None
+            future = asyncio.run_coroutine_threadsafe(expander.close(), _expansion_loop)
+        except RuntimeError:
+            return
+        # Blocking on the loop's own thread would deadlock; the close still runs there
+        if not wait or threading.current_thread().name == _EXPANSION_THREAD_NAME:
+            return
+        try:
+            future.result(timeout=_SESSION_CLOSE_TIMEOUT)
         except Exception as e:
-            logger.warning(f"Error closing database connections: {e}")
+            logger.warning(f"Error closing vocabulary expander session: {e}")
+
+    def _close_database(self):
+        """Close the pool, connection and database handles"""
+        # Each handle is released independently so one failing close doesn't
+        # leak the others; getattr covers a partially constructed router
+        for attr in ("pool", "conn", "db"):
+            resource = getattr(self, attr, None)
+            if resource is None:
+                continue
+            try:
+                resource.close()
+            except (RuntimeError, OSError) as e:
+                logger.warning(f"Error closing database {attr}: {e}")
+            setattr(self, attr, None)
 
     def __del__(self):
         """Cleanup database connections on deletion"""
-        self.close()
+        # Finalizers can run on any thread, so never block here
+        self.close(wait=False)
         
     def setup_skos_routing_tables(self):
         """Create KuzuDB tables for SKOS concept routing"""
@@ -269,6 +408,7 @@ class SKOSSemanticRouter:
                     logger.warning(f"Failed to insert alt label {alt_label}: {e}")
                     
         logger.info(f"Loaded {len(supply_concepts)} SKOS concepts and {len(alt_labels)} alternative labels")
+        self._clear_route_cache()
     
     def route_term_to_preferred(self, original_term: str, source_language: str, target_language: str = 'en') -> Dict[str, Any]:
         """
@@ -282,7 +422,31 @@ class SKOSSemanticRouter:
         Returns:
             Dictionary with routing results including confidence and method
         """
-        
+        cache_key = (original_term.lower().strip(), source_language, target_language)
+        with self._route_cache_lock:
+            cached = self._route_cache.get(cache_key)
+            if cached is not None:
+                self._route_cache.move_to_end(cache_key)
+                return {**cached, 'original_term': original_term}
+
+        result = self._resolve_term(original_term, source_language, target_language)
+
+        # Only matches are remembered so transient expansion failures are retried
+        if result.get('preferred_label'):
+            with self._route_cache_lock:
+                self._route_cache[cache_key] = dict(result)
+                if len(self._route_cache) > _ROUTE_CACHE_SIZE:
+                    self._route_cache.popitem(last=False)
+        return result
+
+    def _clear_route_cache(self):
+        """Forget cached routings after the concept store changes"""
+        with self._route_cache_lock:
+            self._route_cache.clear()
+
+    def _resolve_term(self, original_term: str, source_language: str, target_language: str) -> Dict[str, Any]:
+        """Route a term through preferred, alternative, fuzzy and expansion lookups"""
+
         # Normalize term for matching
         normalized_term = original_term.lower().strip()
         
@@ -297,7 +461,8 @@ class SKOSSemanticRouter:
                        concept.definition as definition
             """
             
-            result = self.conn.execute(pref_query, {'term': normalized_term}).get_next()
+            with self.pool.connection() as conn:
+                result = conn.execute(pref_query, {'term': normalized_term}).get_next()
             
             if result:
                 target_label = result[1] if result[1] else result[2]  # Fallback to English
@@ -322,10 +487,11 @@ class SKOSSemanticRouter:
                        concept.definition as definition
             """
             
-            result = self.conn.execute(alt_query, {
-                'term': normalized_term,
-                'lang': source_language
-            }).get_next()
+            with self.pool.connection() as conn:
+                result = conn.execute(alt_query, {
+                    'term': normalized_term,
+                    'lang': source_language
+                }).get_next()
             
             if result:
                 target_label = result[1] if result[1] else result[2]  # Fallback to English
@@ -347,9 +513,19 @@ class SKOSSemanticRouter:
 
             # Fourth, try vocabulary expansion with public sources
             try:
-                expanded_result = asyncio.run(self.vocabulary_expander.expand_term(
-                    original_term, target_language
-                ))
+                future = asyncio.run_coroutine_threadsafe(
+                    self.vocabulary_expander.expand_term(original_term, target_language),
+                    _get_expansion_loop()
+                )
+                try:
+                    expanded_result = future.result(timeout=_EXPANSION_TIMEOUT)
+                except TimeoutError:
+                    # A hung lookup counts as a failed expansion; stop it on the loop too
+                    future.cancel()
+                    logger.warning(
+                        f"Vocabulary expansion for '{original_term}' timed out after {_EXPANSION_TIMEOUT}s"
+                    )
+                    expanded_result = None
                 if expanded_result and expanded_result.confidence > 0.6:
                     # Store expanded term in local SKOS for future use
                     self._store_expanded_concept(expanded_result, source_language, target_language)
@@ -396,7 +572,8 @@ class SKOSSemanticRouter:
                 LIMIT 1
             """
             
-            result = self.conn.execute(fuzzy_query, {'partial_term': term}).get_next()
+            with self.pool.connection() as conn:
+                result = conn.execute(fuzzy_query, {'partial_term': term}).get_next()
             
             if result:
                 target_label = result[1] if result[1] else result[2]
@@ -428,15 +605,14 @@ class SKOSSemanticRouter:
                        broader.definition as definition
             """
             
-            results = self.conn.execute(hierarchy_query, {'uri': concept_uri})
-            
             hierarchy = []
-            for result in results:
-                hierarchy.append({
-                    'concept_uri': result[0],
-                    'preferred_label': result[1],
-                    'definition': result[2]
-                })
+            with self.pool.connection() as conn:
+                for result in conn.execute(hierarchy_query, {'uri': concept_uri}):
+                    hierarchy.append({
+                        'concept_uri': result[0],
+                        'preferred_label': result[1],
+                        'definition': result[2]
+                    })
                 
             return hierarchy
             
@@ -468,7 +644,8 @@ class SKOSSemanticRouter:
                             "uri": concept_data['concept_uri']
                         }
                     )
-                    
+
+            self._clear_route_cache()
             logger.info(f"Added custom SKOS concept: {concept_data['concept_uri']}")
             
         except Exception as e:
@@ -517,12 +694,25 @@ class SKOSSemanticRouter:
             logger.debug(f"Failed to store expanded concept: {e}")
             # Don't raise - this is just caching for future use
 
-    def close(self):
-        """Close database connections"""
-        if hasattr(self, 'conn'):
-            self.conn.close()
-        if hasattr(self, 'db'):
-            self.db.close()
+
+def get_shared_skos_router(kuzu_db_path: str, fuseki_endpoint: Optional[str] = None) -> SKOSSemanticRouter:
+    """
+    Return the process-wide SKOS router for a KuzuDB path.
+
+    Opening KuzuDB and seeding the SKOS tables is expensive, and a second
+    Database on the same path within one process contends for the file lock,
+    so callers that only need routing should share this instance rather than
+    constructing their own. Callers must not close the shared router; it is
+    closed at interpreter exit, since __del__ is not guaranteed to run.
+    """
+    key = (os.path.abspath(kuzu_db_path), fuseki_endpoint)
+    with _shared_routers_lock:
+        router = _shared_routers.get(key)
+        if router is None:
+            router = SKOSSemanticRouter(key[0], fuseki_endpoint)
+            atexit.register(router.close)
+            _shared_routers[key] = router
+        return router
 
 
 class SKOSEnabledCollector:
@@ -66,6 +66,9 @@ class SKOSVocabularyExpander:
         self.term_cache = {}
         self.load_cache()
 
+        # HTTP session shared by all lookups; the router drives them from one loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
     def _configure_vocabulary_sources(self) -> List[VocabularySource]:
         """Configure public SKOS vocabulary sources"""
         return [
@@ -158,6 +161,18 @@ class SKOSVocabularyExpander:
             logger.warning(f"Vocabulary expansion failed for '{term}': {e}")
             return None
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, reusing its connection pool"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def _search_vocabulary_source(
         self,
         term: str,
@@ -180,33 +195,33 @@ class SKOSVocabularyExpander:
     async def _search_wikidata(self, term: str, language: str) -> Optional[ConceptMatch]:
         """Search Wikidata for term"""
         try:
-            async with aiohttp.ClientSession() as session:
-                # Wikidata search API
-                search_url = f"https://www.wikidata.org/w/api.php"
-                params = {
-                    'action': 'wbsearchentities',
-                    'search': term,
-                    'language': language,
-                    'format': 'json',
-                    'limit': 5,
-                    'type': 'item'
-                }
-
-                async with session.get(search_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if 'search' in data and data['search']:
-                            entity = data['search'][0]  # Take first result
+            session = await self._get_session()
+            # Wikidata search API
+            search_url = f"https://www.wikidata.org/w/api.php"
+            params = {
+                'action': 'wbsearchentities',
+                'search': term,
+                'language': language,
+                'format': 'json',
+                'limit': 5,
+                'type': 'item'
+            }
 
-                            return ConceptMatch(
-                                term=term,
-                                preferred_label=entity.get('label', term),
-                                concept_uri=f"https://www.wikidata.org/entity/{entity['id']}",
-                                source="wikidata",
-                                confidence=self._calculate_similarity(term, entity.get('label', '')),
-                                definition=entity.get('description'),
-                                alt_labels=entity.get('aliases', [])
-                            )
+            async with session.get(search_url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if 'search' in data and data['search']:
+                        entity = data['search'][0]  # Take first result
+
+                        return ConceptMatch(
+                            term=term,
+                            preferred_label=entity.get('label', term),
+                            concept_uri=f"https://www.wikidata.org/entity/{entity['id']}",
+                            source="wikidata",
+                            confidence=self._calculate_similarity(term, entity.get('label', '')),
+                            definition=entity.get('description'),
+                            alt_labels=entity.get('aliases', [])
+                        )
             return None
         except Exception as e:
             logger.debug(f"Wikidata search failed for '{term}': {e}")
@@ -215,40 +230,40 @@ class SKOSVocabularyExpander:
     async def _search_dbpedia(self, term: str, language: str) -> Optional[ConceptMatch]:
         """Search DBpedia for term"""
         try:
-            async with aiohttp.ClientSession() as session:
-                # DBpedia SPARQL endpoint
-                sparql_query = f"""
-                SELECT DISTINCT ?resource ?label ?comment WHERE {{
-                    ?resource rdfs:label ?label .
-                    OPTIONAL {{ ?resource rdfs:comment ?comment }}
-                    FILTER(CONTAINS(LCASE(STR(?label)), LCASE("{term}")))
-                    FILTER(LANG(?label) = "{language}")
-                }} LIMIT 5
-                """
-
-                sparql_url = "https://dbpedia.org/sparql"
-                params = {
-                    'query': sparql_query,
-                    'format': 'json'
-                }
-
-                async with session.get(sparql_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if 'results' in data and 'bindings' in data['results']:
-                            bindings = data['results']['bindings']
-                            if bindings:
-                                result = bindings[0]
-                                label = result['label']['value']
-
-                                return ConceptMatch(
-                                    term=term,
-                                    preferred_label=label,
-                                    concept_uri=result['resource']['value'],
-                                    source="dbpedia",
-                                    confidence=self._calculate_similarity(term, label),
-                                    definition=result.get('comment', {}).get('value')
-                                )
+            session = await self._get_session()
+            # DBpedia SPARQL endpoint
+            sparql_query = f"""
+            SELECT DISTINCT ?resource ?label ?comment WHERE {{
+                ?resource rdfs:label ?label .
+                OPTIONAL {{ ?resource rdfs:comment ?comment }}
+                FILTER(CONTAINS(LCASE(STR(?label)), LCASE("{term}")))
+                FILTER(LANG(?label) = "{language}")
+            }} LIMIT 5
+            """
+
+            sparql_url = "https://dbpedia.org/sparql"
+            params = {
+                'query': sparql_query,
+                'format': 'json'
+            }
+
+            async with session.get(sparql_url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if 'results' in data and 'bindings' in data['results']:
+                        bindings = data['results']['bindings']
+                        if bindings:
+                            result = bindings[0]
+                            label = result['label']['value']
+
+                            return ConceptMatch(
+                                term=term,
+                                preferred_label=label,
+                                concept_uri=result['resource']['value'],
+                                source="dbpedia",
+                                confidence=self._calculate_similarity(term, label),
+                                definition=result.get('comment', {}).get('value')
+                            )
             return None
         except Exception as e:
             logger.debug(f"DBpedia search failed for '{term}': {e}")
@@ -257,30 +272,30 @@ class SKOSVocabularyExpander:
     async def _search_loc_subjects(self, term: str, language: str) -> Optional[ConceptMatch]:
         """Search Library of Congress Subject Headings"""
         try:
-            async with aiohttp.ClientSession() as session:
-                # LOC search API
-                search_url = f"https://id.loc.gov/search/"
-                params = {
-                    'q': term,
-                    'format': 'json',
-                    'count': 5,
-                    'rdftype': 'Concept'
-                }
-
-                async with session.get(search_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if isinstance(data, list) and data:
-                            result = data[0]
+            session = await self._get_session()
+            # LOC search API
+            search_url = f"https://id.loc.gov/search/"
+            params = {
+                'q': term,
+                'format': 'json',
+                'count': 5,
+                'rdftype': 'Concept'
+            }
 
-                            return ConceptMatch(
-                                term=term,
-                                preferred_label=result.get('title', term),
-                                concept_uri=result.get('uri', ''),
-                                source="loc_subjects",
-                                confidence=self._calculate_similarity(term, result.get('title', '')),
-                                definition=result.get('description')
-                            )
+            async with session.get(search_url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if isinstance(data, list) and data:
+                        result = data[0]
+
+                        return ConceptMatch(
+                            term=term,
+                            preferred_label=result.get('title', term),
+                            concept_uri=result.get('uri', ''),
+                            source="loc_subjects",
+                            confidence=self._calculate_similarity(term, result.get('title', '')),
+                            definition=result.get('description')
+                        )
             return None
         except Exception as e:
             logger.debug(f"LOC Subjects search failed for '{term}': {e}")
@@ -289,20 +304,19 @@ class SKOSVocabularyExpander:
     async def _search_eurovoc(self, term: str, language: str) -> Optional[ConceptMatch]:
         """Search EuroVoc thesaurus"""
         try:
-            async with aiohttp.ClientSession() as session:
-                # EuroVoc SPARQL endpoint (simplified approach)
-                sparql_query = f"""
-                SELECT DISTINCT ?concept ?prefLabel ?definition WHERE {{
-                    ?concept skos:prefLabel ?prefLabel .
-                    OPTIONAL {{ ?concept skos:definition ?definition }}
-                    FILTER(CONTAINS(LCASE(STR(?prefLabel)), LCASE("{term}")))
-                    FILTER(LANG(?prefLabel) = "{language}")
-                }} LIMIT 5
-                """
-
-                # Note: This is a simplified implementation
-                # In production, you'd use the actual EuroVoc SPARQL endpoint
-                return None
+            # EuroVoc SPARQL endpoint (simplified approach)
+            sparql_query = f"""
+            SELECT DISTINCT ?concept ?prefLabel ?definition WHERE {{
+                ?concept skos:prefLabel ?prefLabel .
+                OPTIONAL {{ ?concept skos:definition ?definition }}
+                FILTER(CONTAINS(LCASE(STR(?prefLabel)), LCASE("{term}")))
+                FILTER(LANG(?prefLabel) = "{language}")
+            }} LIMIT 5
+            """
+
+            # Note: This is a simplified implementation
+            # In production, you'd use the actual EuroVoc SPARQL endpoint
+            return None
 
         except Exception as e:
             logger.debug(f"EuroVoc search failed for '{term}': {e}")
@@ -0,0 +1,167 @@
+"""Unit tests for SKOS semantic routing."""
+
+import os
+import pytest
+from types import SimpleNamespace
+
+pytest.importorskip("kuzu")
+pytest.importorskip("aiohttp")
+
+from agentic_data_scraper.semantic import skos_router as skos_module
+from agentic_data_scraper.semantic.skos_router import SKOSSemanticRouter, get_shared_skos_router
+
+
+@pytest.fixture(autouse=True)
+def isolated_workdir(tmp_path, monkeypatch):
+    """Keep the expander's relative vocabulary cache inside the test directory."""
+    (tmp_path / "data").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+
+class RecordingConnection:
+    """Stand-in for a Kuzu connection that records executed statements."""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, query, parameters=None):
+        self.statements.append(query)
+
+
+class TestRouteCache:
+    """Test cases for the routing result cache."""
+
+    @pytest.fixture
+    def router(self, tmp_path):
+        """Router on a fresh database."""
+        router = SKOSSemanticRouter(str(tmp_path / "skos.db"))
+        yield router
+        router.close()
+
+    @pytest.fixture
+    def resolve_calls(self, router, monkeypatch):
+        """Replace the database lookups with a recorder returning a preferred match."""
+        calls = []
+
+        def resolve(term, source_language, target_language):
+            calls.append(term)
+            return {
+                'original_term': term,
+                'preferred_label': 'olive oil',
+                'concept_uri': 'http://example.org/concept/olive_oil',
+                'translation_confidence': 1.0,
+                'method': 'SKOS_preferred_match',
+            }
+
+        monkeypatch.setattr(router, "_resolve_term", resolve)
+        return calls
+
+    @pytest.fixture
+    def write_conn(self, router):
+        """Capture concept writes instead of sending them to Kuzu."""
+        real_conn, router.conn = router.conn, RecordingConnection()
+        yield router.conn
+        router.conn = real_conn
+
+    def test_repeated_term_is_served_from_cache(self, router, resolve_calls):
+        """Test that a routed term is only resolved once."""
+        first = router.route_term_to_preferred("zeytin yağı", "tr")
+        second = router.route_term_to_preferred("Zeytin Yağı ", "tr")
+
+        assert first["preferred_label"] == "olive oil"
+        assert second["preferred_label"] == "olive oil"
+        assert second["original_term"] == "Zeytin Yağı "
+        assert resolve_calls == ["zeytin yağı"]
+
+    def test_languages_are_cached_separately(self, router, resolve_calls):
+        """Test that the same term in another language is resolved again."""
+        router.route_term_to_preferred("tarife", "tr")
+        router.route_term_to_preferred("tarife", "tr", target_language="fr")
+
+        assert resolve_calls == ["tarife", "tarife"]
+
+    def test_caller_mutation_does_not_affect_cache(self, router, resolve_calls):
+        """Test that returned results are independent of the cached entry."""
+        first = router.route_term_to_preferred("zeytin yağı", "tr")
+        first["preferred_label"] = "mutated"
+
+        second = router.route_term_to_preferred("zeytin yağı", "tr")
+        second["concept_uri"] = "mutated"
+
+        third = router.route_term_to_preferred("zeytin yağı", "tr")
+        assert third["preferred_label"] == "olive oil"
+        assert third["concept_uri"] == "http://example.org/concept/olive_oil"
+        assert len(resolve_calls) == 1
+
+    def test_adding_concept_clears_cache(self, router, resolve_calls, write_conn):
+        """Test that concept writes invalidate cached routings."""
+        router.route_term_to_preferred("zeytin yağı", "tr")
+
+        router.add_custom_concept(
+            {
+                "concept_uri": "http://example.org/concept/warehouse",
+                "uri": "http://example.org/concept/warehouse",
+                "scheme": "http://example.org/scheme",
+                "en": "warehouse",
+                "tr": "depo",
+                "fr": "entrepôt",
+                "es": "almacén",
+                "def": "Building for storing goods",
+                "broader": None,
+            },
+            alt_labels=[{"alt_label": "ambar", "language": "tr"}],
+        )
+        router.route_term_to_preferred("zeytin yağı", "tr")
+
+        assert len(write_conn.statements) == 2
+        assert resolve_calls == ["zeytin yağı", "zeytin yağı"]
+
+    def test_storing_expanded_concept_keeps_cache(self, router, resolve_calls, write_conn):
+        """Test that caching an expansion result does not flush existing routings."""
+        router.route_term_to_preferred("zeytin yağı", "tr")
+
+        router._store_expanded_concept(
+            SimpleNamespace(
+                concept_uri="http://example.org/concept/warehouse",
+                preferred_label="warehouse",
+                definition=None,
+                source="wikidata",
+                alt_labels=["depot"],
+            ),
+            "tr",
+            "en",
+        )
+        router.route_term_to_preferred("zeytin yağı", "tr")
+
+        assert len(write_conn.statements) == 2
+        assert resolve_calls == ["zeytin yağı"]
+
+
+class TestSharedRouter:
+    """Test cases for the process-wide router accessor."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_registry(self, monkeypatch):
+        """Keep shared routers created here out of the module registry."""
+        monkeypatch.setattr(skos_module, "_shared_routers", {})
+        yield
+        for router in skos_module._shared_routers.values():
+            router.close()
+
+    def test_call_styles_share_one_router(self, tmp_path):
+        """Test that positional, keyword and relative paths resolve to one router."""
+        db_path = tmp_path / "shared.db"
+
+        by_position = get_shared_skos_router(str(db_path))
+        by_keyword = get_shared_skos_router(kuzu_db_path=str(db_path), fuseki_endpoint=None)
+        by_relative = get_shared_skos_router("shared.db")
+
+        assert by_position is by_keyword is by_relative
+        assert by_position.kuzu_db_path == os.path.abspath(db_path)
+
+    def test_distinct_paths_get_distinct_routers(self, tmp_path):
+        """Test that different databases are not shared."""
+        first = get_shared_skos_router(str(tmp_path / "first.db"))
+        second = get_shared_skos_router(str(tmp_path / "second.db"))
+
+        assert first is not second